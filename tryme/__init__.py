@@ -3,7 +3,9 @@
 from http.server import BaseHTTPRequestHandler
 from configparser import ConfigParser
 from cgi import FieldStorage
+from functools import lru_cache
 import json
+import re
 
 
 def join(*elements):
@@ -12,6 +14,58 @@ def join(*elements):
     return ''.join(str(e) for e in elements)
 
 
+CSS_TOKEN = re.compile(r"""
+    ("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')      # string literal, kept as is
+    | (?:\s|/\*.*?\*/)*([{};,])(?:\s|/\*.*?\*/)*  # punctuation, space dropped
+    | (?:\s|/\*.*?\*/)+                         # space or comment, collapsed
+""", re.DOTALL | re.VERBOSE)
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def _css_token(match):
+    string, punctuation = match.groups()
+    if string is not None:
+        return string
+    if punctuation is not None:
+        return punctuation
+    if match.start() == 0 or match.end() == len(match.string):
+        return ''
+    # A bare comment still separates the tokens on either side of it
+    return ' ' if CSS_COMMENT.sub('', match.group()) else '/**/'
+
+
+@lru_cache(maxsize=8)
+def minify_css(source):
+    """Drop comments and redundant whitespace outside string literals.
+
+    >>> minify_css('a  ,  b {\\n  color: red ;\\n}')
+    'a,b{color: red;}'
+    >>> minify_css('/* x */ a/**/b {margin:0/* x */auto} a /* x */ b {}')
+    'a/**/b{margin:0/**/auto}a b{}'
+    >>> minify_css('p::after { content: "  /* x */ ;" }')
+    'p::after{content: "  /* x */ ;"}'
+    """
+    return CSS_TOKEN.sub(_css_token, source).strip()
+
+
+@lru_cache(maxsize=8)
+def minify_js(source):
+    """Strip indentation, blank lines and whole-line comments.
+
+    Line breaks are kept so automatic semicolon insertion still works. This
+    is only safe for scripts without multi-line string literals, so it is
+    not applied to user code.
+
+    >>> print(minify_js("if (a) {\\n\\n    // note\\n    b()\\n}\\n"))
+    if (a) {
+    b()
+    }
+    """
+    lines = (line.strip() for line in source.splitlines())
+    return '\n'.join(
+        line for line in lines if line and not line.startswith('//'))
+
+
 class Tag(dict):
     empty = False
 
@@ -162,6 +216,70 @@ class Library:
             for template in self.data.get('js', '').split())
 
 
+TRYME_JS = r"""
+function consoleOverride(method, handler) {
+    var console = window.console;
+    if (console) {
+        var original = console[method];
+        console[method] = function () {
+            if (!handler.apply(console, arguments)) {
+                if (original.apply) {
+                    // Do this for normal browsers
+                    original.apply(console, arguments);
+                } else {
+                    // Do this for IE
+                    var message = Array.prototype.slice.apply(arguments).join(' ');
+                    original(message);
+                }
+            }
+        }
+    }
+}
+$(".js-console-wrapper").css("position", "static");
+function jsConsoleAppend(cls) {
+    return function () {
+        $("#js-console").append(
+            "<li class=\"" + cls + "\">" +
+            Array.from(arguments).join(', ') +
+            "<\/li>"
+        );
+    }
+}
+consoleOverride('log', jsConsoleAppend("js-console-log"));
+consoleOverride('warn', jsConsoleAppend("js-console-warn"));
+consoleOverride('error', jsConsoleAppend("js-console-error"));
+"""
+TRYME_CSS = r"""
+#js-console-wrapper {
+    position: fixed;
+    width: 100%;
+    top: 67%;
+    height: 33%;
+    overflow-x: hidden;
+    overflow-y: scroll;
+}
+.js-console-warn {
+    background-color: yellow;
+}
+.js-console-error {
+    background-color: red;
+}
+#js-console-wrapper {
+    border-top: 1px solid black;
+}
+#js-console-header,
+.js-console-log,
+.js-console-warn,
+.js-console-error {
+    border-bottom: 1px solid black;
+}
+#js-console {
+    list-style: none;
+    padding-left: 0;
+}
+"""
+
+
 class RequestHandler(BaseHTTPRequestHandler):
     default_html = "&lt;h1 class=\"text-success\"&gt;Success&lt;/h1&gt;"
     default_css = ".text-success {\n  color: green;\n}"
@@ -187,6 +305,7 @@ class RequestHandler(BaseHTTPRequestHandler):
             versions="4.0.0-beta.2",
         ),
     ]
+    bundle = False
 
     def __init__(self, *args, **kwargs):
         self.config =  ConfigParser()
@@ -241,70 +360,10 @@ class RequestHandler(BaseHTTPRequestHandler):
             the_doc = self.make_document('utf-8')
             mime_type = "text/html"
         elif self.path == '/tryme.js':
-            the_doc = r"""
-function consoleOverride(method, handler) {
-    var console = window.console;
-    if (console) {
-        var original = console[method];
-        console[method] = function () {
-            if (!handler.apply(console, arguments)) {
-                if (original.apply) {
-                    // Do this for normal browsers
-                    original.apply(console, arguments);
-                } else {
-                    // Do this for IE
-                    var message = Array.prototype.slice.apply(arguments).join(' ');
-                    original(message);
-                }
-            }
-        }
-    }
-}
-$(".js-console-wrapper").css("position", "static");
-function jsConsoleAppend(cls) {
-    return function () {
-        $("#js-console").append(
-            "<li class=\"" + cls + "\">" +
-            Array.from(arguments).join(', ') +
-            "<\/li>"
-        );
-    }
-}
-consoleOverride('log', jsConsoleAppend("js-console-log"));
-consoleOverride('warn', jsConsoleAppend("js-console-warn"));
-consoleOverride('error', jsConsoleAppend("js-console-error"));
-""".encode('utf-8')
+            the_doc = TRYME_JS.encode('utf-8')
             mime_type = 'text/javascript'
         elif self.path == '/tryme.css':
-            the_doc = r"""
-#js-console-wrapper {
-    position: fixed;
-    width: 100%;
-    top: 67%;
-    height: 33%;
-    overflow-x: hidden;
-    overflow-y: scroll;
-}
-.js-console-warn {
-    background-color: yellow;
-}
-.js-console-error {
-    background-color: red;
-}
-#js-console-wrapper {
-    border-top: 1px solid black;
-}
-#js-console-header,
-.js-console-log,
-.js-console-warn,
-.js-console-error {
-    border-bottom: 1px solid black;
-}
-#js-console {
-    list-style: none;
-    padding-left: 0;
-}
-""".encode('utf-8')
+            the_doc = TRYME_CSS.encode('utf-8')
             mime_type = 'text/css'
         else:
             self.send_response(404)
@@ -324,6 +383,17 @@ consoleOverride('error', jsConsoleAppend("js-console-error"));
         self.send_header("Content-Length", len(the_doc))
         self.end_headers()
 
+    def inline_css(self, source):
+        return minify_css(source) if self.bundle else source
+
+    def inline_js(self, source):
+        return minify_js(source) if self.bundle else source
+
+    def bundled_assets(self):
+        if not self.bundle:
+            return None
+        return dict(css=minify_css(TRYME_CSS), js=minify_js(TRYME_JS))
+
     def make_document(self, charset='utf-8', textarea_rows=20):
         head = Head()(
             Meta({'charset': charset}),
@@ -335,7 +405,7 @@ consoleOverride('error', jsConsoleAppend("js-console-error"));
             *[Link({'rel': 'stylesheet', 'href': url})
                 for lib in self.libraries
                 for url in lib.css()],
-            Style({'type': 'text/css'})("""
+            Style({'type': 'text/css'})(self.inline_css("""
 #preview {
     height: 30em;
     border: 1px solid rgb(206, 212, 218);
@@ -363,13 +433,15 @@ iframe {
     width: 100%;
     height: 100%;
 }
-            """),
+            """)),
         )
         javascript = join(
             *[Script({'src': url})
                 for lib in self.libraries
                 for url in lib.js()],
-            Script()(r"""
+            Script()('var tryMeBundle = {};'.format(
+                json.dumps(self.bundled_assets()).replace('</', '<\\/'))),
+            Script()(self.inline_js(r"""
 function sendToServer() {
     var data = new FormData($("form")[0]);
     var button = $("#submitButton");
@@ -436,7 +508,13 @@ function updateTryMe(force) {
     var the_doc = iframe_window.document;
     the_doc.open();
     the_doc.write("<html><head>")
-    the_doc.write("<link rel=\"stylesheet\" href=\"/tryme.css\">");
+    if (tryMeBundle) {
+        the_doc.write("<style>");
+        the_doc.write(tryMeBundle.css);
+        the_doc.write("<\/style>");
+    } else {
+        the_doc.write("<link rel=\"stylesheet\" href=\"/tryme.css\">");
+    }
     $("[data-template$=\".css\"]").each(function() {
         var version = $(this).closest(".list-group-item").find("select").val();
         var url = $(this).attr("data-template");
@@ -470,7 +548,13 @@ function updateTryMe(force) {
         }
         $(this).text(url);
     });
-    the_doc.write("<script src=\"/tryme.js\"><\/script>");
+    if (tryMeBundle) {
+        the_doc.write("<script>");
+        the_doc.write(tryMeBundle.js);
+        the_doc.write("<\/script>");
+    } else {
+        the_doc.write("<script src=\"/tryme.js\"><\/script>");
+    }
     the_doc.write("<script>")
     the_doc.write(document.getElementById("js-input").value);
     the_doc.write("<\/script></body>");
@@ -488,7 +572,7 @@ $("textarea").keydown(function (event) {
         console.log("Tab");
     }
 })
-            """)
+            """))
         )
         body = Body()(
             Div('container-fluid')(Div('row')(
@@ -11,6 +11,8 @@ parser = argparse.ArgumentParser()
 parser.add_argument('name')
 parser.add_argument('address', nargs='?', default='*')
 parser.add_argument('port', nargs='?', default=8001, type=int)
+parser.add_argument('--bundle', action='store_true',
+                    help='serve minified, content-hashed preview bundles')
 
 args = parser.parse_args()
 
@@ -18,6 +20,7 @@ if args.address == '*':
     args.address = '0.0.0.0'
 
 RequestHandler.name = args.name
+RequestHandler.bundle = args.bundle
 
 httpd = HTTPServer((args.address, args.port), RequestHandler)
 try: